@@ -6,15 +6,25 @@ import random
 from loguru import logger
 
 from PyQt5.QtWidgets import QWidget, QLabel, QDialog, QVBoxLayout, QPushButton, QDesktopWidget, QGraphicsOpacityEffect
-from PyQt5.QtCore import Qt, QPoint, pyqtSignal, QPropertyAnimation, QEasingCurve, QTimer
-from PyQt5.QtGui import QFont, QMouseEvent, QPainter, QColor, QPen, QBrush, QPolygonF
+from PyQt5.QtCore import Qt, QPoint, QLine, QRect, QRectF, pyqtSignal, QPropertyAnimation, QEasingCurve, QTimer, QElapsedTimer
+from PyQt5.QtGui import QFont, QMouseEvent, QPainter, QColor, QPen, QBrush, QGradient, QLinearGradient, QFontMetrics, QImage, QPolygon, QPolygonF, QPixmap, QRegion
 import math
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba 为可选依赖，缺失时使用 NumPy 实现
+    njit = None
 
 from .ClassWidgets.base import PluginBase, SettingsBase
 
 
+# 名单文件缓存：路径 -> ((修改时间, 文件大小), 名单)
+_NAME_CACHE = {}
+
+
 def read_names_from_file(file_path):
-    """读取名单文件并返回处理后的名单列表"""
+    """读取名单文件并返回处理后的名单列表，文件未变化时直接使用缓存"""
     if not os.path.exists(file_path):
         default_names = ["小明", "李华", "张三", "李四", "王五", "赵六"]
         with open(file_path, "w", encoding="utf-8") as f:
@@ -22,60 +32,232 @@ def read_names_from_file(file_path):
         return default_names
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            names = f.read().splitlines()
-        return [name.strip() for name in names if name.strip()]
+        st = os.stat(file_path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _NAME_CACHE.get(file_path)
+        if cached is not None and cached[0] == key:
+            return list(cached[1])
+
+        with open(file_path, "rb") as f:
+            data = f.read()
+        # 单次遍历：按 \n 切分，解码时去除空白（含 \r 与全角空格），跳过空行
+        names = [name for name in (line.decode("utf-8").strip() for line in data.split(b"\n")) if name]
+        _NAME_CACHE[file_path] = (key, names)
+        return list(names)
     except Exception as e:
         logger.error(f"读取名单文件时出错: {e}")
         return ["小明", "李华", "张三", "李四"]
 
 
-class Particle:
-    """粒子类 - 用于创建科学粒子效果"""
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-2, 2)
-        self.vy = random.uniform(-2, 2)
-        self.life = 1.0
-        self.decay = random.uniform(0.005, 0.015)
-        self.size = random.uniform(2, 5)
-        # 理科元素颜色：蓝色、绿色、紫色
-        colors = [
-            QColor(100, 149, 237),  # 蓝色
-            QColor(50, 205, 50),    # 绿色
-            QColor(138, 43, 226),   # 紫色
-            QColor(255, 215, 0),    # 金色
-        ]
-        self.color = random.choice(colors)
+# 显示或换名后持续生成粒子的帧数（约10秒），之后粒子自然消散、动画停止
+PARTICLE_SPAWN_FRAMES = 200
+
+# 理科元素颜色：蓝色、绿色、紫色、金色
+_PARTICLE_COLORS = [
+    QColor(100, 149, 237),  # 蓝色
+    QColor(50, 205, 50),    # 绿色
+    QColor(138, 43, 226),   # 紫色
+    QColor(255, 215, 0),    # 金色
+]
+# 粒子透明度量化的档位数
+_OPACITY_LEVELS = 16
+# 预先烘焙透明度的画刷表：_ALPHA_PALETTE[颜色][透明度档位]
+_ALPHA_PALETTE = [
+    [QBrush(QColor(c.red(), c.green(), c.blue(), int((k + 0.5) / _OPACITY_LEVELS * 255)))
+     for k in range(_OPACITY_LEVELS)]
+    for c in _PARTICLE_COLORS
+]
+
+# 界面字体
+_FONT_TITLE = QFont("微软雅黑", 18, QFont.Bold)
+_FONT_NAME = QFont("黑体", 72, QFont.Bold)
+_FONT_BTN = QFont("微软雅黑", 13, QFont.Bold)
+
+# 理科元素图案的画笔与画刷，透明度已乘上整体的 0.3，绘制时无需再 setOpacity
+_PEN_DNA = QPen(QColor(100, 149, 237, 30), 2)
+_PEN_ORBIT = QPen(QColor(50, 205, 50, 30), 1)
+_BRUSH_NUCLEUS = QBrush(QColor(255, 215, 0, 45))
+_BRUSH_ELECTRON = QBrush(QColor(138, 43, 226, 60))
+_PEN_MOLECULE = QPen(QColor(255, 255, 255, 30), 2)
+_BRUSH_MOLECULE = QBrush(QColor(100, 149, 237, 45))
+
+# DNA双螺旋（宽30、高150）的点位偏移，与位置无关，导入时一次算好
+_HELIX_T = np.arange(0, 150, 5, dtype=np.float32)
+_HELIX_DX1 = 30 * 0.3 * np.sin(_HELIX_T * 0.2)
+_HELIX_DX2 = 30 * 0.3 * np.sin(_HELIX_T * 0.2 + np.pi)
+
+
+def _tick_particles_numpy(n, x, y, vx, vy, life, decay, size, color):
+    """推进前 n 个粒子一帧并原地移除消亡粒子（NumPy 实现），返回存活数量"""
+    x[:n] += vx[:n]
+    y[:n] += vy[:n]
+    life[:n] -= decay[:n]
+    size[:n] *= 0.995
+
+    alive = life[:n] > 0
+    k = int(np.count_nonzero(alive))
+    if k == n:
+        return n  # 没有粒子消亡时无需整理
+
+    # 把存活粒子前移到预分配数组的前 k 位（花式索引会产生一个临时副本）
+    keep = np.flatnonzero(alive)
+    for arr in (x, y, vx, vy, life, decay, size, color):
+        arr[:k] = arr[keep]
+    return k
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _tick_particles(n, x, y, vx, vy, life, decay, size, color):
+        """推进前 n 个粒子一帧并原地移除消亡粒子（Numba 编译），返回存活数量"""
+        j = 0
+        for i in range(n):
+            x[i] += vx[i]
+            y[i] += vy[i]
+            life[i] -= decay[i]
+            size[i] *= np.float32(0.995)
+            if life[i] > 0:
+                # 双指针压缩：存活粒子前移到第 j 位，全部存活时不产生任何拷贝
+                if j != i:
+                    x[j] = x[i]
+                    y[j] = y[i]
+                    vx[j] = vx[i]
+                    vy[j] = vy[i]
+                    life[j] = life[i]
+                    decay[j] = decay[i]
+                    size[j] = size[i]
+                    color[j] = color[i]
+                j += 1
+        return j
+else:
+    _tick_particles = _tick_particles_numpy
+
+_tick_warmed_up = False
+
+
+def warm_up_particle_kernel():
+    """提前触发粒子内核的编译，避免首帧卡顿"""
+    global _tick_warmed_up
+    if _tick_warmed_up:
+        return
+    empty = np.zeros(0, dtype=np.float32)
+    _tick_particles(0, empty, empty, empty, empty, empty, empty, empty, np.zeros(0, dtype=np.uint8))
+    _tick_warmed_up = True
+
+
+def warm_up_fonts():
+    """预先完成中文字体匹配并光栅化常用字形，缩短结果窗口首次显示的耗时"""
+    image = QImage(1, 1, QImage.Format_ARGB32_Premultiplied)
+    painter = QPainter(image)
+    for font, text in ((_FONT_TITLE, "🧬 随机点名 ⚛️"), (_FONT_NAME, "随机点名"),
+                       (_FONT_BTN, "🎲 重新点名 ✅ 确定")):
+        QFontMetrics(font).boundingRect(text)
+        painter.setFont(font)
+        painter.drawText(0, 0, text)
+    painter.end()
+
+
+class ParticlePool:
+    """粒子池 - 以结构数组(SoA)形式保存所有粒子，按批量向量运算更新"""
+    def __init__(self, capacity=128):
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.decay = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.uint8)
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, n, width, height):
+        """在窗口范围内批量生成 n 个新粒子"""
+        n = min(n, self.capacity - self.count)
+        if n <= 0:
+            return
+        s = slice(self.count, self.count + n)
+        self.x[s] = np.random.randint(0, width + 1, n)
+        self.y[s] = np.random.randint(0, height + 1, n)
+        self.vx[s] = np.random.uniform(-2, 2, n)
+        self.vy[s] = np.random.uniform(-2, 2, n)
+        self.life[s] = 1.0
+        self.decay[s] = np.random.uniform(0.005, 0.015, n)
+        self.size[s] = np.random.uniform(2, 5, n)
+        self.color[s] = np.random.randint(0, len(_PARTICLE_COLORS), n)
+        self.count += n
 
     def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.life -= self.decay
-        self.size *= 0.995
-        return self.life > 0
+        """推进一帧并移除生命耗尽的粒子"""
+        self.count = _tick_particles(self.count, self.x, self.y, self.vx, self.vy,
+                                     self.life, self.decay, self.size, self.color)
+
+    def rects(self, margin=2):
+        """返回每个存活粒子（外扩 margin 像素）的矩形列表"""
+        n = self.count
+        xs = self.x[:n].astype(np.int32) - margin
+        ys = self.y[:n].astype(np.int32) - margin
+        sizes = self.size[:n].astype(np.int32) + 2 * margin
+        return [QRect(x, y, s, s) for x, y, s in zip(xs.tolist(), ys.tolist(), sizes.tolist())]
+
+    def clear(self):
+        """清空所有粒子"""
+        self.count = 0
+
+    def draw(self, painter, rect):
+        """绘制与 rect 相交的存活粒子"""
+        n = self.count
+        if not n:
+            return
+        xs = self.x[:n].astype(np.int32)
+        ys = self.y[:n].astype(np.int32)
+        sizes = self.size[:n].astype(np.int32)
+        visible = ((xs + sizes >= rect.left()) & (xs <= rect.right()) &
+                   (ys + sizes >= rect.top()) & (ys <= rect.bottom()))
+        indices = np.flatnonzero(visible)
+        if not indices.size:
+            return
+
+        # 按(颜色, 透明度档位)排序分组，每组只切换一次画刷
+        levels = np.clip((self.life[indices] * _OPACITY_LEVELS).astype(np.int32), 0, _OPACITY_LEVELS - 1)
+        keys = self.color[indices].astype(np.int32) * _OPACITY_LEVELS + levels
+        order = np.argsort(keys, kind="stable")
+        indices, keys = indices[order], keys[order]
+        xs, ys, sizes = xs[indices].tolist(), ys[indices].tolist(), sizes[indices].tolist()
+        splits = (np.flatnonzero(np.diff(keys)) + 1).tolist()
 
-    def draw(self, painter):
-        if self.life > 0:
-            painter.setBrush(QBrush(self.color))
-            painter.setPen(Qt.NoPen)
-            painter.setOpacity(self.life)
-            painter.drawEllipse(int(self.x), int(self.y), int(self.size), int(self.size))
+        painter.setPen(Qt.NoPen)
+        for start, end in zip([0] + splits, splits + [len(xs)]):
+            color_idx, level = divmod(int(keys[start]), _OPACITY_LEVELS)
+            painter.setBrush(_ALPHA_PALETTE[color_idx][level])
+            for i in range(start, end):
+                painter.drawEllipse(xs[i], ys[i], sizes[i], sizes[i])
 
 
 class NameResultDialog(QDialog):
     """显示点名结果的对话框"""
+
+    # 分子节点相对中心的偏移（以分子尺寸为单位）及节点间的连接
+    _MOL_OFFSETS = np.array([(0, -1), (1, 0), (0, 1), (-1, 0), (0.7, -0.7), (-0.7, -0.7)])
+    _MOL_EDGES = np.array([(0, 1), (1, 2), (2, 3), (3, 0), (0, 4), (0, 5)], dtype=np.int32)
     
     def __init__(self, name, parent=None):
         super().__init__(parent)
         self.name = name
         self.opacity_effect = None
         self.fade_animation = None
-        self.particles = []
-        self.animation_timer = QTimer()
+        self.particles = ParticlePool(128)
+        self._bg_cache = None  # 静态理科元素背景缓存
+        self.idle_frames = 0  # 距上次显示/换名经过的帧数
+        self.clock = QElapsedTimer()  # 单调时钟，驱动电子的运动相位
+        self.clock.start()
+        self._electron_t = 0.0  # 最近一帧的电子相位时间（秒），动画停止时保持不变
+        self.animation_timer = QTimer(self)
+        self.animation_timer.setInterval(50)  # 20 FPS，仅在窗口可见时运行
         self.animation_timer.timeout.connect(self.update_particles)
-        self.animation_timer.start(50)  # 20 FPS
         self.init_ui()
         self.move_center()
         self.setup_animation()
@@ -86,14 +268,8 @@ class NameResultDialog(QDialog):
         self.setFixedSize(800, 500)  # 进一步增大窗口尺寸
         self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.Dialog)
         
-        # 设置窗口样式
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #667eea, stop:1 #764ba2);
-                border-radius: 15px;
-            }
-        """)
+        # 渐变背景由 paintEvent 从缓存中绘制，窗口自身无需擦除背景
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
         
         # 创建主布局
         layout = QVBoxLayout(self)
@@ -103,7 +279,7 @@ class NameResultDialog(QDialog):
         # 创建标题标签
         self.title_label = QLabel("🧬 随机点名 ⚛️")
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setFont(QFont("微软雅黑", 18, QFont.Bold))
+        self.title_label.setFont(_FONT_TITLE)
         self.title_label.setStyleSheet("""
             QLabel {
                 color: white;
@@ -116,7 +292,7 @@ class NameResultDialog(QDialog):
         # 创建名字标签
         self.name_label = QLabel(self.name)
         self.name_label.setAlignment(Qt.AlignCenter)
-        self.name_label.setFont(QFont("黑体", 72, QFont.Bold))  # 适中的字体大小
+        self.name_label.setFont(_FONT_NAME)  # 适中的字体大小
         self.name_label.setWordWrap(True)  # 允许文字换行
         self.name_label.setStyleSheet("""
             QLabel {
@@ -138,7 +314,7 @@ class NameResultDialog(QDialog):
         # 创建重新点名按钮
         self.reroll_btn = QPushButton("🎲 重新点名")
         self.reroll_btn.setFixedSize(160, 45)
-        self.reroll_btn.setFont(QFont("微软雅黑", 13, QFont.Bold))
+        self.reroll_btn.setFont(_FONT_BTN)
         self.reroll_btn.setStyleSheet("""
             QPushButton {
                 background: rgba(255, 255, 255, 0.2);
@@ -160,7 +336,7 @@ class NameResultDialog(QDialog):
         # 创建确定按钮
         self.confirm_btn = QPushButton("✅ 确定")
         self.confirm_btn.setFixedSize(160, 45)
-        self.confirm_btn.setFont(QFont("微软雅黑", 13, QFont.Bold))
+        self.confirm_btn.setFont(_FONT_BTN)
         self.confirm_btn.clicked.connect(self.close)
         self.confirm_btn.setStyleSheet("""
             QPushButton {
@@ -218,6 +394,7 @@ class NameResultDialog(QDialog):
         """更新显示的名字"""
         self.name = new_name
         self.name_label.setText(new_name)
+        self.wake_animation()
         # 重新播放淡入动画
         if self.fade_animation:
             self.fade_animation.start()
@@ -226,18 +403,82 @@ class NameResultDialog(QDialog):
         """设置重新点名回调函数"""
         self.reroll_btn.clicked.connect(callback)
 
+    def wake_animation(self):
+        """重新开始生成粒子，并在窗口可见时恢复动画"""
+        self.idle_frames = 0
+        if self.isVisible() and not self.animation_timer.isActive():
+            self.animation_timer.start()
+
     def update_particles(self):
         """更新粒子效果"""
+        self.idle_frames += 1
+        spawning = self.idle_frames <= PARTICLE_SPAWN_FRAMES
+        if not spawning and not len(self.particles):
+            # 粒子已全部消散，停止动画直到再次显示或换名
+            self.animation_timer.stop()
+            return
+
+        # 旧位置也需要重绘以擦除粒子
+        dirty = QRegion()
+        for rect in self.particles.rects():
+            dirty += rect
+
         # 生成新粒子
-        if len(self.particles) < 30:
-            for _ in range(2):
-                x = random.randint(0, self.width())
-                y = random.randint(0, self.height())
-                self.particles.append(Particle(x, y))
+        if spawning and len(self.particles) < 30:
+            self.particles.spawn(2, self.width(), self.height())
         
         # 更新现有粒子
-        self.particles = [p for p in self.particles if p.update()]
-        self.update()  # 触发重绘
+        self.particles.update()
+        for rect in self.particles.rects():
+            dirty += rect
+
+        # 电子一直在轨道上运动
+        self._electron_t = self.clock.elapsed() * 1e-3
+        for cx, cy in self.atom_centers():
+            dirty += QRect(cx - 48, cy - 48, 96, 96)
+        self.update(dirty)  # 只重绘受影响的区域
+
+    def showEvent(self, event):
+        """显示时确保背景缓存可用并启动动画"""
+        super().showEvent(event)
+        if self._bg_cache is None or self._bg_cache.size() != self.size() * self.devicePixelRatioF():
+            self._build_background_cache()
+        warm_up_particle_kernel()
+        self.wake_animation()
+
+    def hideEvent(self, event):
+        """隐藏或最小化时暂停动画"""
+        self.animation_timer.stop()
+        super().hideEvent(event)
+
+    def closeEvent(self, event):
+        """关闭时停止动画并清空粒子"""
+        self.animation_timer.stop()
+        self.particles.clear()
+        super().closeEvent(event)
+
+    def resizeEvent(self, event):
+        """尺寸变化时重建背景缓存"""
+        super().resizeEvent(event)
+        self._build_background_cache()
+
+    def _build_background_cache(self):
+        """将渐变背景和静态的理科元素预先绘制到 QPixmap 中"""
+        ratio = self.devicePixelRatioF()
+        self._bg_cache = QPixmap(self.size() * ratio)
+        self._bg_cache.setDevicePixelRatio(ratio)
+
+        painter = QPainter(self._bg_cache)
+        # 与原样式表 qlineargradient(x1:0, y1:0, x2:1, y2:1) 一致，坐标相对窗口矩形
+        gradient = QLinearGradient(0, 0, 1, 1)
+        gradient.setCoordinateMode(QGradient.ObjectBoundingMode)
+        gradient.setColorAt(0, QColor("#667eea"))
+        gradient.setColorAt(1, QColor("#764ba2"))
+        painter.fillRect(self.rect(), gradient)
+
+        painter.setRenderHint(QPainter.Antialiasing)
+        self.draw_science_elements(painter)
+        painter.end()
 
     def paintEvent(self, event):
         """绘制粒子效果和理科元素"""
@@ -245,97 +486,98 @@ class NameResultDialog(QDialog):
         
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
+        painter.setClipRegion(event.region())
+        
+        # 背景与静态理科元素直接贴缓存
+        if self._bg_cache is None:
+            self._build_background_cache()
+        painter.drawPixmap(0, 0, self._bg_cache)
         
         # 绘制粒子
-        for particle in self.particles:
-            particle.draw(painter)
+        self.particles.draw(painter, event.rect())
         
-        # 绘制理科元素图案
-        self.draw_science_elements(painter)
+        # 只实时绘制运动的电子
+        for cx, cy in self.atom_centers():
+            self.draw_electrons(painter, cx, cy, 40)
+
+    def atom_centers(self):
+        """原子结构的中心坐标"""
+        return [(100, self.height() - 100), (self.width() - 100, self.height() - 100)]
 
     def draw_science_elements(self, painter):
-        """绘制理科元素图案"""
-        painter.setOpacity(0.3)
-        
+        """绘制静态的理科元素图案"""
         # 绘制DNA双螺旋结构
-        self.draw_dna_helix(painter, 50, 100, 30, 150)
-        self.draw_dna_helix(painter, self.width() - 80, 100, 30, 150)
+        self.draw_dna_helix(painter, 50, 100)
+        self.draw_dna_helix(painter, self.width() - 80, 100)
         
         # 绘制原子结构
-        self.draw_atom(painter, 100, self.height() - 100, 40)
-        self.draw_atom(painter, self.width() - 100, self.height() - 100, 40)
+        for cx, cy in self.atom_centers():
+            self.draw_atom(painter, cx, cy, 40)
         
         # 绘制分子结构
         self.draw_molecule(painter, self.width() // 2, 80, 25)
 
-    def draw_dna_helix(self, painter, x, y, width, height):
+    def draw_dna_helix(self, painter, x, y):
         """绘制DNA双螺旋"""
-        painter.setPen(QPen(QColor(100, 149, 237, 100), 2))
+        painter.setPen(_PEN_DNA)
         
-        points1 = []
-        points2 = []
-        for i in range(0, height, 5):
-            angle = i * 0.2
-            x1 = x + width * 0.3 * math.sin(angle)
-            x2 = x + width * 0.3 * math.sin(angle + math.pi)
-            points1.append(QPoint(int(x1), y + i))
-            points2.append(QPoint(int(x2), y + i))
+        ys = (y + _HELIX_T).astype(np.int32)
+        xs1 = (x + _HELIX_DX1).astype(np.int32)
+        xs2 = (x + _HELIX_DX2).astype(np.int32)
         
-        # 绘制螺旋线
-        for i in range(len(points1) - 1):
-            painter.drawLine(points1[i], points1[i + 1])
-            painter.drawLine(points2[i], points2[i + 1])
-            
-            # 绘制连接线
-            if i % 10 == 0:
-                painter.drawLine(points1[i], points2[i])
+        # 绘制螺旋线：每条链由一次 drawPolyline 完成
+        for xs in (xs1, xs2):
+            strand = QPolygon()
+            strand.setPoints(np.column_stack((xs, ys)).ravel().tolist())
+            painter.drawPolyline(strand)
+        
+        # 绘制连接线
+        rungs = np.column_stack((xs1, ys, xs2, ys))[:-1:10].tolist()
+        painter.drawLines([QLine(*rung) for rung in rungs])
 
     def draw_atom(self, painter, cx, cy, radius):
-        """绘制原子结构"""
+        """绘制原子核与电子轨道"""
         # 原子核
-        painter.setBrush(QBrush(QColor(255, 215, 0, 150)))
+        painter.setBrush(_BRUSH_NUCLEUS)
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(cx - 5, cy - 5, 10, 10)
         
         # 电子轨道
         painter.setBrush(Qt.NoBrush)
-        painter.setPen(QPen(QColor(50, 205, 50, 100), 1))
+        painter.setPen(_PEN_ORBIT)
         
         for i in range(3):
             r = radius * (0.5 + i * 0.3)
-            painter.drawEllipse(cx - r, cy - r, 2 * r, 2 * r)
-            
-            # 电子
-            angle = self.animation_timer.remainingTime() * 0.01 + i * 2
+            painter.drawEllipse(QRectF(cx - r, cy - r, 2 * r, 2 * r))
+
+    def draw_electrons(self, painter, cx, cy, radius):
+        """绘制沿轨道运动的电子"""
+        painter.setBrush(_BRUSH_ELECTRON)
+        painter.setPen(Qt.NoPen)
+        
+        t = self._electron_t
+        for i in range(3):
+            r = radius * (0.5 + i * 0.3)
+            angle = t * 2 + i * 2
             ex = cx + r * math.cos(angle)
             ey = cy + r * math.sin(angle)
-            painter.setBrush(QBrush(QColor(138, 43, 226, 200)))
             painter.drawEllipse(int(ex - 3), int(ey - 3), 6, 6)
 
     def draw_molecule(self, painter, cx, cy, size):
         """绘制分子结构"""
-        painter.setBrush(QBrush(QColor(100, 149, 237, 150)))
-        painter.setPen(QPen(QColor(255, 255, 255, 100), 2))
+        painter.setBrush(_BRUSH_MOLECULE)
+        painter.setPen(_PEN_MOLECULE)
         
         # 分子节点
-        nodes = [
-            (cx, cy - size),
-            (cx + size, cy),
-            (cx, cy + size),
-            (cx - size, cy),
-            (cx + size * 0.7, cy - size * 0.7),
-            (cx - size * 0.7, cy - size * 0.7)
-        ]
+        nodes = self._MOL_OFFSETS * size + (cx, cy)
         
-        # 绘制连接线
-        connections = [(0, 1), (1, 2), (2, 3), (3, 0), (0, 4), (0, 5)]
-        for start, end in connections:
-            painter.drawLine(int(nodes[start][0]), int(nodes[start][1]),
-                           int(nodes[end][0]), int(nodes[end][1]))
+        # 绘制连接线：一次 drawLines 画出全部连接
+        ends = nodes.astype(np.int32)[self._MOL_EDGES].reshape(-1, 4).tolist()
+        painter.drawLines([QLine(*line) for line in ends])
         
         # 绘制节点
-        for x, y in nodes:
-            painter.drawEllipse(int(x - 4), int(y - 4), 8, 8)
+        for x, y in (nodes - 4).astype(np.int32).tolist():
+            painter.drawEllipse(x, y, 8, 8)
 
 
 class FloatingWindow(QWidget):
@@ -346,8 +588,8 @@ class FloatingWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.names = []
-        self.shuffled_names = []
-        self.current_index = 0
+        self._order = []  # 名字下标，末尾 len(names) - _remaining 个为本轮已抽取
+        self._remaining = 0
         self.drag_pos = QPoint()
         self.mouse_press_pos = QPoint()
         self.result_dialog = None
@@ -386,10 +628,9 @@ class FloatingWindow(QWidget):
         logger.info(f"随机点名：加载了 {len(self.names)} 个名字")
 
     def reset_shuffle(self):
-        """执行洗牌算法重置队列"""
-        self.shuffled_names = self.names.copy()
-        random.shuffle(self.shuffled_names)
-        self.current_index = 0
+        """重置洗牌队列，所有名字重新进入待抽取范围"""
+        self._order = list(range(len(self.names)))
+        self._remaining = len(self.names)
 
     def move_to_corner(self):
         """移动窗口到屏幕右下角"""
@@ -459,19 +700,30 @@ class FloatingWindow(QWidget):
 
     def get_next_name(self):
         """获取下一个不重复的名字"""
-        if not self.shuffled_names:
+        if not self.names:
             return "名单为空"
 
-        if self.current_index >= len(self.shuffled_names):
-            self.reset_shuffle()
+        if self._remaining == 0:
+            self._remaining = len(self.names)
             logger.debug("随机点名：重新洗牌")
 
-        name = self.shuffled_names[self.current_index]
-        self.current_index += 1
-        return name
+        # 逐步执行Fisher-Yates洗牌：每次只交换一个元素
+        j = random.randrange(self._remaining)
+        self._remaining -= 1
+        last = self._remaining
+        self._order[j], self._order[last] = self._order[last], self._order[j]
+        return self.names[self._order[last]]
 
     def closeEvent(self, event):
         """窗口关闭事件"""
+        if self.result_dialog is not None:
+            # 释放结果对话框，避免其计时器在窗口关闭后继续运行
+            self.result_dialog.animation_timer.stop()
+            self.result_dialog.reroll_btn.clicked.disconnect()
+            self.result_dialog.close()
+            self.result_dialog.deleteLater()
+            self.result_dialog = None
+            logger.debug("随机点名：释放结果对话框")
         self.closed.emit()
         super().closeEvent(event)
 
@@ -485,6 +737,7 @@ class Plugin(PluginBase):
         
         # 注册小组件以触发execute方法
         self.method.register_widget("random-name-widget.ui", "随机点名", 0)
+        warm_up_fonts()
         logger.info("随机点名插件初始化完成")
 
     def execute(self):